@@ -3,11 +3,25 @@ import json
 import os
 import sys
 import re
-import glob
+import functools
+import hashlib
+import http.client
+import io
+import queue
 import subprocess
 import tempfile
+import threading
+import traceback
+import urllib.parse
 import urllib.request
 import shutil
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+# Paths are resolved once at import
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+PLUGINS_DIR = REPO_ROOT / "plugins"
 
 # Constants for validation
 REQUIRED_TOP_LEVEL = {"plugin_id", "versions", "public_keys"}
@@ -16,6 +30,14 @@ REQUIRED_ARTIFACT_LEVEL = {"os", "arch", "url", "sha256", "minisign"}
 VALID_OS = {"macos"}
 VALID_ARCH = {"arm64"}
 
+# Field -> expected type tables for the optional v2 objects. Every present
+# field is type-checked from these in a single pass.
+REQUIRED_SECRET_FIELDS = ("id", "label", "required")
+SECRET_FIELD_TYPES = {"id": str, "label": str, "required": bool, "description": str, "url": str}
+DOCS_FIELD_TYPES = {"readme": str, "changelog": str}
+REQUIRED_LINK_FIELDS = ("label", "url")
+TYPE_NAMES = {str: "a string", bool: "a boolean"}
+
 # SemVer regex (simplified but robust enough for basic validation)
 # Matches 1.0.0, 1.0.0-beta, 1.0.0+build, etc.
 SEMVER_REGEX = re.compile(r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$")
@@ -23,7 +45,118 @@ SEMVER_REGEX = re.compile(r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-((?:0|[
 # Minisign public key format: starts with "RW" and is base64 encoded (typically 56 chars)
 MINISIGN_PUBKEY_REGEX = re.compile(r"^RW[A-Za-z0-9+/]{50,}={0,2}$")
 
+# Base64 payload lines of a minisign signature (lines 2 and 4)
+BASE64_REGEX = re.compile(r"^[A-Za-z0-9+/]+=*$")
+
+# Dot-separated plugin id, e.g. osaurus.time, osaurus.macos-use
+PLUGIN_ID_REGEX = re.compile(r"^[a-z0-9]+(\.[a-z0-9_-]+)+$")
+
+# Number of threads used to validate plugin files when signature verification
+# (artifact downloads) is enabled. The work is network-bound, so this can
+# comfortably exceed the CPU count.
+VERIFY_WORKERS = 16
+
+# Below this many plugin files, process start-up costs more than validating
+# the files serially, so the process pool is only used for larger registries.
+PROCESS_POOL_MIN_FILES = 200
+
+# Leading bytes read to sniff a plugin file before parsing it
+JSON_SNIFF_SIZE = 64
+
+# Read size used when streaming artifact downloads
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Chunks buffered between the download and the thread writing it to disk
+DOWNLOAD_QUEUE_DEPTH = 4
+
+# Socket timeout for artifact downloads, in seconds
+DOWNLOAD_TIMEOUT = 30
+
+# GitHub release URLs redirect to a CDN host before serving the file
+MAX_REDIRECTS = 5
+
+def _reject_constant(name):
+    raise ValueError(f"Invalid JSON constant {name!r}")
+
+def load_json(raw):
+    """
+    Parse JSON from str or bytes. Bytes are decoded strictly as UTF-8
+    (json.loads would otherwise also accept UTF-16/32), and the non-standard
+    NaN/Infinity constants are rejected. Every failure is a ValueError.
+    """
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8")
+    return json.loads(raw, parse_constant=_reject_constant)
+
+def signature_verification_enabled():
+    """Check if signature verification is enabled (via environment variable)."""
+    return os.environ.get("VERIFY_SIGNATURES", "").lower() in ("1", "true", "yes")
+
+#
+# Output capture for parallel validation. Validators report problems with
+# plain print(); when several files are validated at once, each worker's
+# output is collected into its own buffer and replayed by main() in file
+# order so the log reads the same as a serial run.
+_capture_local = threading.local()
+_capture_lock = threading.Lock()
+
+
+class _ThreadLocalStdout:
+    """sys.stdout wrapper that routes writes to the current thread's capture buffer, if any."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        buffer = getattr(_capture_local, "buffer", None)
+        if buffer is None:
+            return self._stream.write(text)
+        return buffer.write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def run_captured(fn, *args):
+    """Call fn(*args) and return (result, everything it printed)."""
+    with _capture_lock:
+        if not isinstance(sys.stdout, _ThreadLocalStdout):
+            sys.stdout = _ThreadLocalStdout(sys.stdout)
+
+    previous = getattr(_capture_local, "buffer", None)
+    buffer = _capture_local.buffer = io.StringIO()
+    try:
+        return fn(*args), buffer.getvalue()
+    finally:
+        _capture_local.buffer = previous
+
+def is_sha256_hex(value):
+    """
+    Check that value is a 64-character hex SHA-256 digest. bytes.fromhex does
+    the character check in C; it also skips whitespace between byte pairs,
+    which the decoded-length check rules out.
+    """
+    if not isinstance(value, str) or len(value) != 64:
+        return False
+    try:
+        return len(bytes.fromhex(value)) == 32
+    except ValueError:
+        return False
+
 def validate_semver(version):
+    # Fast path for plain X.Y.Z, which nearly every version is. Anything that
+    # doesn't fit falls through to the full regex, which stays authoritative.
+    if '-' not in version and '+' not in version:
+        parts = version.split('.')
+        if len(parts) == 3:
+            for part in parts:
+                if not (part.isascii() and part.isdigit()) or (len(part) > 1 and part[0] == '0'):
+                    break
+            else:
+                return True
     return bool(SEMVER_REGEX.match(version))
 
 def validate_public_keys(public_keys, context):
@@ -67,26 +200,32 @@ def validate_minisign_signature(minisign_obj, context):
     # - Line 2: Base64 signature (starts with key algorithm prefix, e.g., "RW")
     # - Line 3: "trusted comment: ..."
     # - Line 4: Base64 global signature
-    lines = signature.strip().split('\n')
-    if len(lines) != 4:
-        print(f"Error in {context}: Invalid minisign signature format (expected 4 lines, got {len(lines)})")
+    # Check the line count and slice out only the lines that are inspected,
+    # rather than splitting the whole signature into a list
+    s = signature.strip()
+    line_count = s.count('\n') + 1
+    if line_count != 4:
+        print(f"Error in {context}: Invalid minisign signature format (expected 4 lines, got {line_count})")
         return False
     
-    if not lines[0].startswith("untrusted comment:"):
+    nl1 = s.index('\n')
+    nl2 = s.index('\n', nl1 + 1)
+    nl3 = s.index('\n', nl2 + 1)
+    
+    if not s.startswith("untrusted comment:"):
         print(f"Error in {context}: Minisign signature must start with 'untrusted comment:'")
         return False
     
-    if not lines[2].startswith("trusted comment:"):
+    if not s.startswith("trusted comment:", nl2 + 1):
         print(f"Error in {context}: Minisign signature line 3 must start with 'trusted comment:'")
         return False
     
     # Verify line 2 and 4 are base64 (signature data)
-    base64_pattern = re.compile(r"^[A-Za-z0-9+/]+=*$")
-    if not base64_pattern.match(lines[1]):
+    if not BASE64_REGEX.match(s[nl1 + 1:nl2]):
         print(f"Error in {context}: Invalid base64 in minisign signature line 2")
         return False
     
-    if not base64_pattern.match(lines[3]):
+    if not BASE64_REGEX.match(s[nl3 + 1:]):
         print(f"Error in {context}: Invalid base64 in minisign signature line 4")
         return False
     
@@ -109,6 +248,99 @@ KEY_ROTATION_ALLOWLIST = {
 }
 
 
+# Base-branch contents of the plugin files, keyed by repo-relative path and
+# filled in once by main() in PR context. None means the file does not exist
+# on the base branch; paths that are absent fall back to `git show`.
+_base_branch_files = {}
+
+def prefetch_base_branch_files(base_ref, filepaths):
+    """
+    Read the base-branch version of every file through a single
+    `git cat-file --batch` process rather than forking `git show` per file.
+    Returns {rel_path: contents or None}, or {} if git could not be run.
+    """
+    rel_paths = [path.relative_to(REPO_ROOT).as_posix() for path in filepaths]
+    queries = "".join(f"origin/{base_ref}:{rel_path}\n" for rel_path in rel_paths)
+    try:
+        result = subprocess.run(
+            ["git", "cat-file", "--batch"],
+            input=queries.encode(),
+            capture_output=True,
+            cwd=REPO_ROOT
+        )
+    except OSError as e:
+        print(f"Warning: Could not read {base_ref} versions of plugin files: {e}")
+        return {}
+    if result.returncode != 0:
+        return {}
+
+    # Each reply is "<sha> <type> <size>\n<contents>\n", or
+    # "<name> missing\n" when the path does not exist on the base branch.
+    contents = {}
+    out = result.stdout
+    pos = 0
+    for rel_path in rel_paths:
+        eol = out.index(b"\n", pos)
+        header = out[pos:eol].split(b" ")
+        pos = eol + 1
+        if len(header) == 3 and header[2].isdigit():
+            size = int(header[2])
+            if header[1] == b"blob":
+                contents[rel_path] = out[pos:pos + size].decode("utf-8", errors="replace")
+            else:
+                contents[rel_path] = None
+            pos += size + 1
+        else:
+            contents[rel_path] = None
+    return contents
+
+def _init_worker(base_branch_files):
+    """Process pool initializer: hand the prefetched base-branch files to the worker."""
+    global _base_branch_files
+    _base_branch_files = base_branch_files
+
+# Returned by _load_base_branch_public_key when the base-branch version of a
+# file exists but could not be read or parsed
+UNAVAILABLE = object()
+
+@functools.lru_cache(maxsize=None)
+def _load_base_branch_public_key(filepath, base_ref):
+    """
+    Return the base branch's public_keys.minisign for filepath: the key
+    string ("" if the file has none), None if the file doesn't exist on the
+    base branch, or UNAVAILABLE if it couldn't be read. Memoized so the git
+    lookup and JSON parse happen at most once per file.
+    """
+    # Get relative path for git
+    rel_path = filepath.relative_to(REPO_ROOT).as_posix()
+    
+    try:
+        # Try to get the file from base branch
+        if rel_path in _base_branch_files:
+            base_contents = _base_branch_files[rel_path]
+        else:
+            result = subprocess.run(
+                ["git", "show", f"origin/{base_ref}:{rel_path}"],
+                capture_output=True,
+                text=True,
+                cwd=REPO_ROOT
+            )
+            base_contents = result.stdout if result.returncode == 0 else None
+        
+        if base_contents is None:
+            return None
+        
+        # Parse the base branch version
+        base_data = load_json(base_contents)
+        return base_data.get("public_keys", {}).get("minisign", "")
+        
+    except ValueError:
+        print(f"  Warning: Could not parse base branch version of {filepath}")
+        return UNAVAILABLE
+    except Exception as e:
+        print(f"  Warning: Could not check public key immutability: {e}")
+        return UNAVAILABLE
+
 def check_public_key_immutability(filepath, current_public_key):
     """
     Check that public key hasn't changed from base branch.
@@ -120,111 +352,320 @@ def check_public_key_immutability(filepath, current_public_key):
         # Not in PR context, skip immutability check
         return True
     
-    # Get relative path for git
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    repo_root = os.path.dirname(script_dir)
-    rel_path = os.path.relpath(filepath, repo_root)
+    base_public_key = _load_base_branch_public_key(filepath, base_ref)
     
-    try:
-        # Try to get the file from base branch
-        result = subprocess.run(
-            ["git", "show", f"origin/{base_ref}:{rel_path}"],
-            capture_output=True,
-            text=True,
-            cwd=repo_root
-        )
-        
-        if result.returncode != 0:
-            # File doesn't exist on base branch - this is a new plugin, allow any public key
-            print(f"  New plugin detected (not on {base_ref}), public key registration allowed")
-            return True
-        
-        # Parse the base branch version
-        base_data = json.loads(result.stdout)
-        base_public_key = base_data.get("public_keys", {}).get("minisign", "")
-        
-        if not base_public_key:
-            # No public key on base branch (shouldn't happen with new requirements)
-            print(f"  No public key found on {base_ref}, allowing initial registration")
-            return True
-        
-        if current_public_key != base_public_key:
-            plugin_id = os.path.splitext(os.path.basename(filepath))[0]
-            if plugin_id in KEY_ROTATION_ALLOWLIST:
-                print(
-                    f"  WARNING: public key change permitted via KEY_ROTATION_ALLOWLIST for {plugin_id}"
-                )
-                print(f"    Base branch ({base_ref}) key: {base_public_key}")
-                print(f"    Current key: {current_public_key}")
-                print(
-                    "    REMOVE this entry from KEY_ROTATION_ALLOWLIST after the rotation PR merges."
-                )
-                return True
-
-            print(f"Error: Public key modification detected!")
-            print(f"  Base branch ({base_ref}) key: {base_public_key}")
-            print(f"  Current key: {current_public_key}")
-            print(f"  Public keys are IMMUTABLE after initial registration.")
-            print(f"  Only the original author (holder of the private key) can sign updates.")
-            return False
-        
-        print(f"  Public key unchanged from {base_ref} (immutability check passed)")
+    if base_public_key is UNAVAILABLE:
         return True
-        
-    except json.JSONDecodeError:
-        print(f"  Warning: Could not parse base branch version of {filepath}")
+    
+    if base_public_key is None:
+        # File doesn't exist on base branch - this is a new plugin, allow any public key
+        print(f"  New plugin detected (not on {base_ref}), public key registration allowed")
         return True
-    except Exception as e:
-        print(f"  Warning: Could not check public key immutability: {e}")
+    
+    if not base_public_key:
+        # No public key on base branch (shouldn't happen with new requirements)
+        print(f"  No public key found on {base_ref}, allowing initial registration")
         return True
+    
+    if current_public_key != base_public_key:
+        plugin_id = filepath.stem
+        if plugin_id in KEY_ROTATION_ALLOWLIST:
+            print(
+                f"  WARNING: public key change permitted via KEY_ROTATION_ALLOWLIST for {plugin_id}"
+            )
+            print(f"    Base branch ({base_ref}) key: {base_public_key}")
+            print(f"    Current key: {current_public_key}")
+            print(
+                "    REMOVE this entry from KEY_ROTATION_ALLOWLIST after the rotation PR merges."
+            )
+            return True
 
-def verify_artifact_signature(artifact, public_key, context):
-    """Download artifact and verify minisign signature against public key."""
-    url = artifact["url"]
-    signature = artifact["minisign"]["signature"]
+        print(f"Error: Public key modification detected!")
+        print(f"  Base branch ({base_ref}) key: {base_public_key}")
+        print(f"  Current key: {current_public_key}")
+        print(f"  Public keys are IMMUTABLE after initial registration.")
+        print(f"  Only the original author (holder of the private key) can sign updates.")
+        return False
     
-    # Create temporary directory for verification
-    tmpdir = tempfile.mkdtemp(prefix="osaurus_verify_")
+    print(f"  Public key unchanged from {base_ref} (immutability check passed)")
+    return True
+
+#
+# Keep-alive connection pool for artifact downloads. Artifacts of a plugin
+# usually live on the same host (GitHub releases and its CDN), so idle HTTPS
+# connections are kept per host and reused by later downloads, on any thread,
+# instead of paying a TCP + TLS handshake for every artifact. Hosts behind an
+# HTTPS proxy are fetched through urllib instead, which knows how to use it.
+_idle_connections = {}
+_idle_connections_lock = threading.Lock()
+
+def _acquire_connection(host):
+    """Take an idle connection to host, a (hostname, port) pair, from the pool, or open a new one."""
+    with _idle_connections_lock:
+        idle = _idle_connections.get(host)
+        if idle:
+            return idle.pop(), True
+    return http.client.HTTPSConnection(*host, timeout=DOWNLOAD_TIMEOUT), False
+
+def _release_connection(host, conn, response):
+    """
+    Return conn to the pool once response has been fully read. conn is None
+    for responses fetched through urllib, which are just closed.
+    """
+    if conn is None:
+        response.close()
+        return
+    if response.will_close:
+        conn.close()
+        return
+    with _idle_connections_lock:
+        _idle_connections.setdefault(host, []).append(conn)
+
+def _request(host, target):
+    """Send a GET for target to host over a pooled connection. Returns (conn, response)."""
+    conn, reused = _acquire_connection(host)
     try:
-        # Download artifact
-        artifact_path = os.path.join(tmpdir, "artifact.zip")
-        print(f"  Downloading {url}...")
+        conn.request("GET", target, headers={"User-Agent": "osaurus-tools-validate"})
+        return conn, conn.getresponse()
+    except (OSError, http.client.HTTPException):
+        conn.close()
+        if not reused:
+            raise
+    # An idle connection can fail in many ways (reset, TLS error, timeout) once
+    # the server has dropped it; retry once on a fresh one
+    conn = http.client.HTTPSConnection(*host, timeout=DOWNLOAD_TIMEOUT)
+    conn.request("GET", target, headers={"User-Agent": "osaurus-tools-validate"})
+    return conn, conn.getresponse()
+
+def _uses_proxy(hostname):
+    """Check whether the environment routes HTTPS requests for hostname through a proxy."""
+    return "https" in urllib.request.getproxies() and not urllib.request.proxy_bypass(hostname)
+
+def open_url(url):
+    """
+    GET an https URL, following redirects. Returns (host, conn, response) for
+    a 200 response; hand conn back with _release_connection after reading
+    the body. Raises OSError on any other outcome.
+    """
+    for _ in range(MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme != "https":
+            raise OSError(f"Refusing to download non-HTTPS URL {url}")
+        if _uses_proxy(parts.hostname):
+            return None, None, urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        # Connect by hostname and port so any userinfo in the netloc is ignored
+        host = (parts.hostname, parts.port)
+        conn, response = _request(host, target)
+        if response.status == 200:
+            return host, conn, response
+
+        location = response.getheader("Location")
+        response.read()
+        _release_connection(host, conn, response)
+        if response.status not in (301, 302, 303, 307, 308) or not location:
+            raise OSError(f"HTTP Error {response.status}: {response.reason}")
+        url = urllib.parse.urljoin(url, location)
+
+    raise OSError(f"Too many redirects (more than {MAX_REDIRECTS})")
+
+# Plugin files and each version's artifacts are verified on nested thread
+# pools; this caps how many downloads (each with its own writer thread) run
+# at once across all of them.
+_download_slots = threading.BoundedSemaphore(VERIFY_WORKERS)
+
+def _write_chunks(chunks, f, errors):
+    """Writer thread for download_artifact: drain chunks into f until None."""
+    while (chunk := chunks.get()) is not None:
+        if errors:
+            continue  # keep draining so the producer never blocks
         try:
-            urllib.request.urlretrieve(url, artifact_path)
-        except Exception as e:
-            print(f"  Warning in {context}: Could not download artifact for signature verification: {e}")
+            f.write(chunk)
+        except BaseException as e:
+            errors.append(e)
+
+def download_artifact(url, dest):
+    """
+    Stream url into dest, hashing the bytes as they arrive. Returns the
+    SHA-256 hex digest of the download. Raises on any network error,
+    including a body shorter than its Content-Length.
+
+    Chunks are handed to a writer thread through a bounded queue, so reading
+    the network and hashing overlap with the disk writes.
+    """
+    with _download_slots:
+        return _stream_to_file(url, dest)
+
+def _stream_to_file(url, dest):
+    """Body of download_artifact, run while holding a download slot."""
+    digest = hashlib.sha256()
+    host, conn, response = open_url(url)
+    # read() returns short data rather than raising if the server closes
+    # early, so compare the byte count against the advertised length
+    expected = response.length
+    received = 0
+    try:
+        with open(dest, "wb") as f:
+            chunks = queue.Queue(maxsize=DOWNLOAD_QUEUE_DEPTH)
+            write_errors = []
+            writer = threading.Thread(target=_write_chunks, args=(chunks, f, write_errors))
+            writer.start()
+            try:
+                while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+                    chunks.put(chunk)
+                    digest.update(chunk)
+                    received += len(chunk)
+            finally:
+                chunks.put(None)
+                writer.join()
+            if write_errors:
+                raise write_errors[0]
+        if expected is not None and received != expected:
+            raise OSError(f"Download incomplete: received {received} of {expected} bytes")
+    except BaseException:
+        if conn is None:
+            response.close()
+        else:
+            conn.close()
+        raise
+    _release_connection(host, conn, response)
+    return digest.hexdigest()
+
+def run_minisign(artifact_path, public_key, sig_path):
+    """Run minisign verification and return the completed process."""
+    # -P takes the base64 public key directly, so no key file is needed
+    return subprocess.run(
+        ["minisign", "-V", "-P", public_key, "-m", artifact_path, "-x", sig_path],
+        capture_output=True,
+        text=True
+    )
+
+# Verification outcomes keyed by (url, sha256, public key, sha256 of the
+# signature), so an artifact shared by several plugins or versions is only
+# downloaded and verified once per run. Each entry is a Future: the first
+# caller for a key does the work and concurrent callers wait on its result.
+_verified_artifacts = {}
+_verified_artifacts_lock = threading.Lock()
+
+def verify_artifact_signature(artifact, public_key, context, workdir):
+    """
+    Download artifact into workdir and verify minisign signature against
+    public key. workdir is created here; the caller owns its cleanup.
+    """
+    url = artifact["url"]
+    signature = artifact["minisign"]["signature"]
+    
+    cache_key = (
+        url,
+        artifact["sha256"].lower(),
+        public_key,
+        hashlib.sha256(signature.encode()).hexdigest(),
+    )
+    with _verified_artifacts_lock:
+        outcome = _verified_artifacts.get(cache_key)
+        owner = outcome is None
+        if owner:
+            outcome = _verified_artifacts[cache_key] = Future()
+    
+    if not owner:
+        verified = outcome.result()
+        if verified is None:
+            print(f"  Warning in {context}: Could not download artifact for signature verification")
             print(f"  Skipping signature verification (artifact unreachable)")
-            return True  # Don't fail on unreachable artifacts (might be new release not yet published)
-        
-        # Write public key file (minisign format requires specific format)
-        pubkey_path = os.path.join(tmpdir, "minisign.pub")
-        with open(pubkey_path, 'w') as f:
-            f.write(f"untrusted comment: minisign public key\n{public_key}\n")
-        
-        # Write signature file
-        sig_path = os.path.join(tmpdir, "artifact.zip.minisig")
-        with open(sig_path, 'w') as f:
-            f.write(signature)
-        
-        # Run minisign verification
-        result = subprocess.run(
-            ["minisign", "-V", "-p", pubkey_path, "-m", artifact_path, "-x", sig_path],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode != 0:
-            print(f"Error in {context}: Minisign signature verification FAILED")
-            print(f"  minisign output: {result.stderr.strip()}")
-            print(f"  This artifact was NOT signed by the registered public key!")
+            return True
+        if not verified:
+            print(f"Error in {context}: Verification of {url} already FAILED earlier in this run")
             return False
-        
-        print(f"  Signature verified for {os.path.basename(url)}")
+        print(f"  Signature verified for {os.path.basename(url)} (cached)")
         return True
-        
+    
+    verified = None
+    try:
+        verified = _download_and_verify(artifact, public_key, context, workdir)
+    finally:
+        # Unreachable artifacts (and unexpected errors) are not cached, so a
+        # later reference gets a fresh attempt
+        if verified is None:
+            with _verified_artifacts_lock:
+                del _verified_artifacts[cache_key]
+        outcome.set_result(verified)
+    
+    # Don't fail on unreachable artifacts (might be new release not yet published)
+    return verified is not False
+
+def _download_and_verify(artifact, public_key, context, workdir):
+    """
+    Do the work for verify_artifact_signature. Returns True if verified,
+    False if the checksum or signature is wrong, None if unreachable.
+    """
+    url = artifact["url"]
+    signature = artifact["minisign"]["signature"]
+    os.mkdir(workdir)
+    
+    # Download artifact
+    artifact_path = os.path.join(workdir, "artifact.zip")
+    print(f"  Downloading {url}...")
+    try:
+        sha256 = download_artifact(url, artifact_path)
+    except Exception as e:
+        print(f"  Warning in {context}: Could not download artifact for signature verification: {e}")
+        print(f"  Skipping signature verification (artifact unreachable)")
+        return None
+    
+    # The checksum is computed during the download, so a tampered or
+    # mismatched artifact fails here without running minisign at all
+    if sha256 != artifact["sha256"].lower():
+        print(f"Error in {context}: SHA256 checksum mismatch")
+        print(f"  Expected: {artifact['sha256']}")
+        print(f"  Actual:   {sha256}")
+        return False
+    
+    # Write signature file
+    sig_path = os.path.join(workdir, "artifact.zip.minisig")
+    with open(sig_path, 'w') as f:
+        f.write(signature)
+    
+    result = run_minisign(artifact_path, public_key, sig_path)
+    
+    if result.returncode != 0:
+        print(f"Error in {context}: Minisign signature verification FAILED")
+        print(f"  minisign output: {result.stderr.strip()}")
+        print(f"  This artifact was NOT signed by the registered public key!")
+        return False
+    
+    print(f"  Signature verified for {os.path.basename(url)}")
+    return True
+
+def verify_artifact_signatures(pending, public_key):
+    """
+    Verify signatures for a list of (artifact, context) pairs concurrently.
+    Artifacts are independent and each one is dominated by network latency
+    and minisign startup, so they run on a thread pool sharing one temporary
+    directory. Output is reported in artifact order. Returns True if all pass.
+    """
+    valid = True
+    tmpdir = tempfile.mkdtemp(prefix="osaurus_verify_")
+    try:
+        with ThreadPoolExecutor(max_workers=min(len(pending), VERIFY_WORKERS)) as executor:
+            futures = [
+                executor.submit(
+                    run_captured, verify_artifact_signature,
+                    artifact, public_key, context, os.path.join(tmpdir, str(idx))
+                )
+                for idx, (artifact, context) in enumerate(pending)
+            ]
+            for future in futures:
+                ok, output = future.result()
+                print(output, end="")
+                if not ok:
+                    valid = False
     finally:
         # Clean up temporary directory
         shutil.rmtree(tmpdir, ignore_errors=True)
+    return valid
 
 def validate_secrets(secrets, context):
     """Validate the optional secrets array (v2)."""
@@ -240,26 +681,15 @@ def validate_secrets(secrets, context):
             valid = False
             continue
 
-        for required_field in ("id", "label", "required"):
+        for required_field in REQUIRED_SECRET_FIELDS:
             if required_field not in secret:
                 print(f"Error in {sc}: missing required field '{required_field}'")
                 valid = False
 
-        if "id" in secret and not isinstance(secret["id"], str):
-            print(f"Error in {sc}: 'id' must be a string")
-            valid = False
-        if "label" in secret and not isinstance(secret["label"], str):
-            print(f"Error in {sc}: 'label' must be a string")
-            valid = False
-        if "required" in secret and not isinstance(secret["required"], bool):
-            print(f"Error in {sc}: 'required' must be a boolean")
-            valid = False
-        if "description" in secret and not isinstance(secret["description"], str):
-            print(f"Error in {sc}: 'description' must be a string")
-            valid = False
-        if "url" in secret and not isinstance(secret["url"], str):
-            print(f"Error in {sc}: 'url' must be a string")
-            valid = False
+        for field, expected in SECRET_FIELD_TYPES.items():
+            if field in secret and not isinstance(secret[field], expected):
+                print(f"Error in {sc}: '{field}' must be {TYPE_NAMES[expected]}")
+                valid = False
 
     return valid
 
@@ -341,12 +771,10 @@ def validate_docs(docs, context):
 
     valid = True
 
-    if "readme" in docs and not isinstance(docs["readme"], str):
-        print(f"Error in {context}: 'docs.readme' must be a string")
-        valid = False
-    if "changelog" in docs and not isinstance(docs["changelog"], str):
-        print(f"Error in {context}: 'docs.changelog' must be a string")
-        valid = False
+    for field, expected in DOCS_FIELD_TYPES.items():
+        if field in docs and not isinstance(docs[field], expected):
+            print(f"Error in {context}: 'docs.{field}' must be {TYPE_NAMES[expected]}")
+            valid = False
 
     if "links" in docs:
         links = docs["links"]
@@ -360,19 +788,19 @@ def validate_docs(docs, context):
                     print(f"Error in {lc}: each link must be an object")
                     valid = False
                     continue
-                if "label" not in link or not isinstance(link["label"], str):
-                    print(f"Error in {lc}: link must have a string 'label'")
-                    valid = False
-                if "url" not in link or not isinstance(link["url"], str):
-                    print(f"Error in {lc}: link must have a string 'url'")
-                    valid = False
+                for field in REQUIRED_LINK_FIELDS:
+                    if not isinstance(link.get(field), str):
+                        print(f"Error in {lc}: link must have a string '{field}'")
+                        valid = False
 
     return valid
 
 
 def validate_artifact(artifact, context):
-    missing = REQUIRED_ARTIFACT_LEVEL - set(artifact.keys())
-    if missing:
+    # dict_keys is set-like: the subset test needs no intermediate set, and
+    # the difference is only computed to report what is missing.
+    if not REQUIRED_ARTIFACT_LEVEL <= artifact.keys():
+        missing = REQUIRED_ARTIFACT_LEVEL - artifact.keys()
         print(f"Error in {context}: Missing required artifact fields: {missing}")
         return False
     
@@ -389,7 +817,7 @@ def validate_artifact(artifact, context):
         print(f"Error in {context}: URL must start with https://")
         return False
         
-    if not re.match(r"^[a-fA-F0-9]{64}$", artifact["sha256"]):
+    if not is_sha256_hex(artifact["sha256"]):
         print(f"Error in {context}: Invalid SHA256 checksum format")
         return False
     
@@ -400,8 +828,8 @@ def validate_artifact(artifact, context):
     return True
 
 def validate_version(entry, context, public_key=None, verify_signatures=False):
-    missing = REQUIRED_VERSION_LEVEL - set(entry.keys())
-    if missing:
+    if not REQUIRED_VERSION_LEVEL <= entry.keys():
+        missing = REQUIRED_VERSION_LEVEL - entry.keys()
         print(f"Error in {context}: Missing required version fields: {missing}")
         return False
         
@@ -415,6 +843,7 @@ def validate_version(entry, context, public_key=None, verify_signatures=False):
 
     valid = True
     has_macos_arm64 = False
+    pending_signatures = []
     
     for idx, artifact in enumerate(entry["artifacts"]):
         artifact_context = f"{context} -> artifact[{idx}]"
@@ -426,8 +855,11 @@ def validate_version(entry, context, public_key=None, verify_signatures=False):
             
             # Verify signature if enabled and public key available
             if verify_signatures and public_key:
-                if not verify_artifact_signature(artifact, public_key, artifact_context):
-                    valid = False
+                pending_signatures.append((artifact, artifact_context))
+    
+    if pending_signatures:
+        if not verify_artifact_signatures(pending_signatures, public_key):
+            valid = False
             
     # Artifact Check: Ensure at least one macos/arm64 artifact exists per version
     if not has_macos_arm64:
@@ -444,88 +876,100 @@ def validate_version(entry, context, public_key=None, verify_signatures=False):
                  
     return valid
 
-def validate_plugin_file(filepath, seen_ids):
+def validate_plugin_file(filepath):
+    """
+    Validate a single plugin file.
+
+    Returns (ok, lower_id). lower_id is the case-folded plugin_id once it has
+    passed the format checks (None otherwise); duplicate detection across
+    files is left to the caller so files can be validated independently.
+    """
     print(f"Validating {filepath}...")
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
+        with open(filepath, 'rb') as f:
+            # A plugin file is a JSON object; reject anything that plainly
+            # isn't from its first bytes instead of reading and parsing it all
+            head = f.read(JSON_SNIFF_SIZE)
+            first = head.lstrip()[:1]
+            if first and first != b"{":
+                print(f"Error: Invalid JSON in {filepath}: expected a JSON object")
+                return False, None
+            data = load_json(head + f.read())
+    except ValueError as e:
+        # JSONDecodeError, UnicodeDecodeError and rejected constants alike
         print(f"Error: Invalid JSON in {filepath}: {e}")
-        return False
+        return False, None
+
+    if not isinstance(data, dict):
+        print(f"Error: Invalid JSON in {filepath}: expected a JSON object")
+        return False, None
         
-    missing = REQUIRED_TOP_LEVEL - set(data.keys())
-    if missing:
+    if not REQUIRED_TOP_LEVEL <= data.keys():
+        missing = REQUIRED_TOP_LEVEL - data.keys()
         print(f"Error: Missing required top-level fields in {filepath}: {missing}")
-        return False
+        return False, None
     
     plugin_id = data.get("plugin_id", "")
     
     # Consistency Check: Ensure plugin_id matches the filename
-    filename = os.path.basename(filepath)
-    if not filename.endswith(".json"):
+    filename = filepath.name
+    if filepath.suffix != ".json":
         print(f"Error: File {filepath} must end in .json")
-        return False
+        return False, None
         
-    expected_id = filename[:-5] # remove .json
+    expected_id = filepath.stem
     if plugin_id != expected_id:
         print(f"Error: plugin_id '{plugin_id}' does not match filename '{filename}' (expected '{expected_id}')")
-        return False
+        return False, None
         
     if plugin_id != plugin_id.lower():
         print(f"Error: plugin_id '{plugin_id}' must be lower-case")
-        return False
+        return False, None
 
-    if not re.match(r"^[a-z0-9]+(\.[a-z0-9_-]+)+$", plugin_id):
+    if not PLUGIN_ID_REGEX.match(plugin_id):
         print(f"Error: plugin_id '{plugin_id}' must be in dot-separated format (e.g., osaurus.time, osaurus.macos-use)")
-        return False
+        return False, None
 
-    # Unique Constraint: Ensure no duplicate plugin_ids (case-insensitive)
     lower_id = plugin_id.lower()
-    if lower_id in seen_ids:
-        print(f"Error: Duplicate plugin_id found: '{plugin_id}'. Another file already uses this ID (case-insensitive match).")
-        return False
-    seen_ids.add(lower_id)
 
     if not isinstance(data["versions"], list):
         print(f"Error: 'versions' must be a list in {filepath}")
-        return False
+        return False, lower_id
 
     # Validate public_keys (required even for unreleased plugins)
     if not validate_public_keys(data["public_keys"], filepath):
-        return False
+        return False, lower_id
     
     public_key = data["public_keys"]["minisign"]
-    
-    # Check public key immutability (only in PR context)
-    if not check_public_key_immutability(filepath, public_key):
-        return False
 
     # Validate optional v2 fields
     if "secrets" in data:
         if not validate_secrets(data["secrets"], filepath):
-            return False
+            return False, lower_id
 
     if "capabilities" in data:
         if not validate_capabilities(data["capabilities"], filepath):
-            return False
+            return False, lower_id
 
     if "docs" in data:
         if not validate_docs(data["docs"], filepath):
-            return False
+            return False, lower_id
+
+    # Check public key immutability (only in PR context). This is the only
+    # check that consults git, so it runs after every local check has passed.
+    # It still applies to unreleased plugins: skipping it there would let a
+    # PR swap the key by emptying `versions` and re-add releases later.
+    if not check_public_key_immutability(filepath, public_key):
+        return False, lower_id
 
     # Empty versions array is allowed for unreleased plugins
     if len(data["versions"]) == 0:
         print(f"  Note: No versions published yet for {plugin_id}")
-        return True
+        return True, lower_id
 
-    # Check if signature verification is enabled (via environment variable)
-    verify_signatures = os.environ.get("VERIFY_SIGNATURES", "").lower() in ("1", "true", "yes")
+    verify_signatures = signature_verification_enabled()
     
     if verify_signatures:
-        # Check if minisign is available
-        if shutil.which("minisign") is None:
-            print("Error: VERIFY_SIGNATURES is enabled but minisign is not installed")
-            return False
         print(f"  Signature verification enabled for {plugin_id}")
 
     valid = True
@@ -533,16 +977,33 @@ def validate_plugin_file(filepath, seen_ids):
         if not validate_version(version_entry, f"{filepath} -> version[{idx}]", public_key, verify_signatures):
             valid = False
             
-    return valid
+    return valid, lower_id
 
-def check_catalog_drift(script_dir):
+def _validate_plugin_file_guarded(filepath):
+    """
+    Run validate_plugin_file, turning an unexpected exception into a failed
+    result so the file is named and the output printed so far is kept.
+    """
+    try:
+        return validate_plugin_file(filepath)
+    except Exception:
+        print(f"Error: unexpected failure validating {filepath}:")
+        print(traceback.format_exc(), end="")
+        return False, None
+
+def validate_plugin_file_worker(filepath):
+    """Pool entry point: returns (ok, lower_id, output) for a single plugin file."""
+    (ok, lower_id), output = run_captured(_validate_plugin_file_guarded, filepath)
+    return ok, lower_id, output
+
+def check_catalog_drift():
     """
     Run scripts/regenerate-catalogs.py --check to detect drift between
     plugins/<id>.json catalog files and the embedded dylib manifests in
     tools/<tool>/Sources/*/Plugin.swift.
     """
-    regen_script = os.path.join(script_dir, "regenerate-catalogs.py")
-    if not os.path.isfile(regen_script):
+    regen_script = SCRIPT_DIR / "regenerate-catalogs.py"
+    if not regen_script.is_file():
         # Not present in older trees — skip silently.
         return True
 
@@ -561,30 +1022,83 @@ def check_catalog_drift(script_dir):
 
 def main():
     # Look for plugins directory relative to this script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    plugins_dir = os.path.join(os.path.dirname(script_dir), "plugins")
-    
-    if not os.path.isdir(plugins_dir):
-        print(f"Error: plugins directory not found at {plugins_dir}")
+    if not PLUGINS_DIR.is_dir():
+        print(f"Error: plugins directory not found at {PLUGINS_DIR}")
         sys.exit(1)
 
-    json_files = glob.glob(os.path.join(plugins_dir, "*.json"))
+    # scandir hands back size metadata with the listing, so empty files are
+    # reported here without being opened
+    json_files = []
+    empty_files = []
+    with os.scandir(PLUGINS_DIR) as entries:
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.name.endswith(".json") or not entry.is_file():
+                continue
+            if entry.stat().st_size == 0:
+                empty_files.append(PLUGINS_DIR / entry.name)
+            else:
+                json_files.append(PLUGINS_DIR / entry.name)
     
-    if not json_files:
+    if not json_files and not empty_files:
         print("No plugin files found to validate.")
         # Not an error, just empty repo check
         return 0 
 
+    # Check once that minisign is available rather than once per plugin
+    if signature_verification_enabled() and shutil.which("minisign") is None:
+        print("Error: VERIFY_SIGNATURES is enabled but minisign is not installed")
+        sys.exit(1)
+
+    # In PR context, read every file's base-branch version up front for the
+    # public key immutability check.
+    global _base_branch_files
+    base_ref = os.environ.get("GITHUB_BASE_REF", "")
+    if base_ref:
+        _base_branch_files = prefetch_base_branch_files(base_ref, json_files)
+
+    # Files are independent, so validate them concurrently. Signature
+    # verification is dominated by downloads (which release the GIL), so
+    # threads are enough there; the plain JSON/regex path is CPU-bound and
+    # gets a process per core once there are enough files to pay for it.
+    if signature_verification_enabled():
+        with ThreadPoolExecutor(max_workers=VERIFY_WORKERS) as executor:
+            results = list(executor.map(validate_plugin_file_worker, json_files))
+    elif len(json_files) >= PROCESS_POOL_MIN_FILES:
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(_base_branch_files,)
+        ) as executor:
+            results = list(executor.map(validate_plugin_file_worker, json_files))
+    else:
+        results = [validate_plugin_file_worker(json_file) for json_file in json_files]
+
     failed = False
-    seen_ids = set()
-    
-    for json_file in json_files:
-        if not validate_plugin_file(json_file, seen_ids):
+    # lower_id -> first file that used it, so a duplicate names both files
+    seen_ids = {}
+
+    for empty_file in empty_files:
+        print(f"Validating {empty_file}...")
+        print(f"Error: Invalid JSON in {empty_file}: file is empty")
+        failed = True
+
+    for json_file, (ok, lower_id, output) in zip(json_files, results):
+        print(output, end="")
+        if not ok:
             failed = True
+        if lower_id is None:
+            continue
+
+        # Unique Constraint: Ensure no duplicate plugin_ids (case-insensitive)
+        if lower_id in seen_ids:
+            print(f"Error: Duplicate plugin_id found: '{lower_id}' in {json_file}. First seen in {seen_ids[lower_id]} (case-insensitive match).")
+            failed = True
+            continue
+        seen_ids[lower_id] = json_file
 
     # Catalog-vs-manifest drift check (covers official tools whose source
     # lives alongside the registry; external plugins are unaffected).
-    if not check_catalog_drift(script_dir):
+    if not check_catalog_drift():
         failed = True
 
     if failed: